@@ -6,6 +6,7 @@ from __future__ import annotations
 import argparse
 import hashlib
 import html
+import io
 import json
 import os
 from pathlib import Path
@@ -143,6 +144,20 @@ def write_github_output(output, key: str, value: object) -> None:
     output.write(f"{key}<<{delimiter}\n{text}\n{delimiter}\n")
 
 
+def write_bytes(path: Path, data: bytes, append: bool = False) -> None:
+    """Write a whole file with os.write(), skipping the buffered/text io layers."""
+
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    flags |= os.O_APPEND if append else os.O_TRUNC
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def cap_markdown_summary(summary: str) -> str:
     """Keep the job-summary append below GitHub's per-step size limits."""
 
@@ -422,7 +437,8 @@ def main() -> None:
 
     summary_md.parent.mkdir(parents=True, exist_ok=True)
     report_html.parent.mkdir(parents=True, exist_ok=True)
-    summary_md.write_text(
+    write_bytes(
+        summary_md,
         render_summary(
             status,
             stop_reason,
@@ -440,10 +456,10 @@ def main() -> None:
             uart_log,
             summary_md,
             report_html,
-        ),
-        encoding="utf-8",
+        ).encode("utf-8"),
     )
-    report_html.write_text(
+    write_bytes(
+        report_html,
         render_html(
             status,
             stop_reason,
@@ -459,15 +475,16 @@ def main() -> None:
             script,
             digest,
             read_uart(uart_log),
-        ),
-        encoding="utf-8",
+        ).encode("utf-8"),
     )
 
+    # Collect every output first, then append them to GITHUB_OUTPUT in one write.
+    outputs = io.StringIO()
+    write_github_output(outputs, "status", status)
+    write_github_output(outputs, "summary_md", summary_md)
+    write_github_output(outputs, "report_html", report_html)
     github_output.parent.mkdir(parents=True, exist_ok=True)
-    with github_output.open("a", encoding="utf-8") as output:
-        write_github_output(output, "status", status)
-        write_github_output(output, "summary_md", summary_md)
-        write_github_output(output, "report_html", report_html)
+    write_bytes(github_output, outputs.getvalue().encode("utf-8"), append=True)
 
 
 if __name__ == "__main__":
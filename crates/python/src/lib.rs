@@ -5,7 +5,9 @@ use labwired_core::{
     system::{cortex_m, riscv},
     Arch, DebugControl, SimulationError, StopReason,
 };
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
+use std::collections::HashMap;
 use std::path::PathBuf;
 use std::sync::{Arc, Mutex};
 
@@ -91,9 +93,31 @@ fn build_bus(system_path: Option<PathBuf>) -> anyhow::Result<SystemBus> {
 /// This class provides a direct interface to the Rust simulation core, allowing
 /// for loading firmware, stepping execution, inspecting state, and time-travel debugging.
 struct Machine {
-    inner: Arc<Mutex<Box<dyn DebugControl + Send>>>,
+    inner: Arc<Mutex<Box<Simulator>>>,
 }
 
+type Simulator = dyn DebugControl + Send;
+
+impl Machine {
+    /// Run `f` on the locked simulator with the GIL released.
+    ///
+    /// Every method goes through here, so the lock is never waited on while
+    /// holding the GIL: a call that queues behind a long `step` on another
+    /// thread blocks only its own thread, not every Python thread.
+    fn with_machine<R: Send>(
+        &self,
+        py: Python<'_>,
+        f: impl FnOnce(&mut Simulator) -> R + Send,
+    ) -> R {
+        let inner = &self.inner;
+        py.allow_threads(|| f(&mut **inner.lock().unwrap()))
+    }
+}
+
+// Every method takes `&self`: all state sits behind `inner`'s mutex, which is
+// what serialises threads. `step` runs with the GIL released, and a `&mut self`
+// borrow held across that would make other threads' calls fail with
+// "Already mutably borrowed" instead of waiting for the lock.
 #[allow(non_local_definitions)]
 #[pymethods]
 impl Machine {
@@ -118,7 +142,7 @@ impl Machine {
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
 
         // Create Machine based on Architecture
-        let machine: Box<dyn DebugControl + Send> = match program.arch {
+        let machine: Box<Simulator> = match program.arch {
             Arch::Arm => {
                 let (cpu, _nvic) = cortex_m::configure_cortex_m(&mut bus);
                 let mut m = labwired_core::Machine::new(cpu, bus);
@@ -157,12 +181,39 @@ impl Machine {
     ///
     /// Returns:
     ///     StopReason: The reason why the simulation stopped (e.g., Breakpoint, MaxStepsReached).
-    fn step(&mut self, max_steps: Option<u32>) -> PyResult<PyStopReason> {
-        let mut guard = self.inner.lock().unwrap();
-        let reason = guard.run(max_steps).map_err(PySimulationError)?;
+    ///
+    /// The GIL is released while the simulation runs, so other Python threads
+    /// (including ones driving other Machine instances) keep running. Calls on
+    /// this same Machine from another thread wait for the step to finish.
+    fn step(&self, py: Python<'_>, max_steps: Option<u32>) -> PyResult<PyStopReason> {
+        let reason = self
+            .with_machine(py, |m| m.run(max_steps))
+            .map_err(PySimulationError)?;
         Ok(reason.into())
     }
 
+    /// Run several step batches back to back.
+    ///
+    /// Equivalent to calling `step(n)` for each `n` in turn, but the GIL is
+    /// released once for the whole sequence instead of once per batch.
+    ///
+    /// Args:
+    ///     batches (List[int]): Maximum number of instructions for each batch.
+    ///
+    /// Returns:
+    ///     List[StopReason]: The stop reason of each batch, in order.
+    fn step_many(&self, py: Python<'_>, batches: Vec<u32>) -> PyResult<Vec<PyStopReason>> {
+        let reasons = self
+            .with_machine(py, |m| {
+                batches
+                    .into_iter()
+                    .map(|n| m.run(Some(n)))
+                    .collect::<Result<Vec<_>, _>>()
+            })
+            .map_err(PySimulationError)?;
+        Ok(reasons.into_iter().map(Into::into).collect())
+    }
+
     /// Read a core register by its ID.
     ///
     /// Args:
@@ -170,9 +221,8 @@ impl Machine {
     ///
     /// Returns:
     ///     int: The 32-bit value of the register.
-    fn read_register(&self, id: u8) -> u32 {
-        let guard = self.inner.lock().unwrap();
-        guard.read_core_reg(id)
+    fn read_register(&self, py: Python<'_>, id: u8) -> u32 {
+        self.with_machine(py, |m| m.read_core_reg(id))
     }
 
     /// Write a value to a core register.
@@ -180,9 +230,36 @@ impl Machine {
     /// Args:
     ///     id (int): The register ID.
     ///     val (int): The 32-bit value to write.
-    fn write_register(&mut self, id: u8, val: u32) {
-        let mut guard = self.inner.lock().unwrap();
-        guard.write_core_reg(id, val);
+    fn write_register(&self, py: Python<'_>, id: u8, val: u32) {
+        self.with_machine(py, |m| m.write_core_reg(id, val));
+    }
+
+    /// Read several core registers under a single lock.
+    ///
+    /// Equivalent to calling `read_register` once per ID, but crosses into the
+    /// simulator once for the whole batch.
+    ///
+    /// Args:
+    ///     ids (Sequence[int]): The register IDs to read, in order.
+    ///
+    /// Returns:
+    ///     List[int]: The 32-bit value of each register, in the order requested.
+    fn read_registers(&self, py: Python<'_>, ids: Vec<u8>) -> Vec<u32> {
+        self.with_machine(py, |m| {
+            ids.into_iter().map(|id| m.read_core_reg(id)).collect()
+        })
+    }
+
+    /// Write several core registers under a single lock.
+    ///
+    /// Args:
+    ///     values (Dict[int, int]): Mapping of register ID to the 32-bit value to write.
+    fn write_registers(&self, py: Python<'_>, values: HashMap<u8, u32>) {
+        self.with_machine(py, |m| {
+            for (id, val) in values {
+                m.write_core_reg(id, val);
+            }
+        });
     }
 
     /// Read a block of memory.
@@ -193,23 +270,45 @@ impl Machine {
     ///
     /// Returns:
     ///     List[int]: The bytes read from memory.
-    fn read_memory(&self, addr: u32, len: usize) -> PyResult<Vec<u8>> {
-        let guard = self.inner.lock().unwrap();
-        guard
-            .read_memory(addr, len)
+    fn read_memory(&self, py: Python<'_>, addr: u32, len: usize) -> PyResult<Vec<u8>> {
+        self.with_machine(py, |m| m.read_memory(addr, len))
             .map_err(PySimulationError)
             .map_err(Into::into)
     }
 
+    /// Read a block of memory into a caller-provided writable buffer.
+    ///
+    /// Reads exactly `len(out)` bytes, so a `bytearray` (or any writable
+    /// buffer of bytes) can be reused across reads instead of allocating a
+    /// new result each time.
+    ///
+    /// Args:
+    ///     addr (int): The start address.
+    ///     out (bytearray): The buffer to fill.
+    fn read_memory_into(&self, py: Python<'_>, addr: u32, out: &PyAny) -> PyResult<()> {
+        let buf = PyBuffer::<u8>::get(out)?;
+        let len = buf.item_count();
+        let data = self
+            .with_machine(py, |m| m.read_memory(addr, len))
+            .map_err(PySimulationError)?;
+        buf.copy_from_slice(py, &data)
+    }
+
     /// Write a block of memory.
     ///
     /// Args:
     ///     addr (int): The start address.
-    ///     data (List[int]): The bytes to write.
-    fn write_memory(&mut self, addr: u32, data: Vec<u8>) -> PyResult<()> {
-        let mut guard = self.inner.lock().unwrap();
-        guard
-            .write_memory(addr, &data)
+    ///     data (bytes | bytearray | memoryview | List[int]): The bytes to write.
+    ///         Anything exposing a byte buffer is copied in a single block;
+    ///         other sequences are converted element by element.
+    fn write_memory(&self, py: Python<'_>, addr: u32, data: &PyAny) -> PyResult<()> {
+        // A byte buffer is copied out in one go (a memcpy when contiguous)
+        // rather than converted element by element like a list.
+        let bytes = match PyBuffer::<u8>::get(data) {
+            Ok(buf) => buf.to_vec(py)?,
+            Err(_) => data.extract::<Vec<u8>>()?,
+        };
+        self.with_machine(py, |m| m.write_memory(addr, &bytes))
             .map_err(PySimulationError)
             .map_err(Into::into)
     }
@@ -218,9 +317,8 @@ impl Machine {
     ///
     /// Returns:
     ///     str: A JSON string containing the full state of the CPU and peripherals.
-    fn snapshot(&self) -> PyResult<String> {
-        let guard = self.inner.lock().unwrap();
-        let snap = guard.snapshot();
+    fn snapshot(&self, py: Python<'_>) -> PyResult<String> {
+        let snap = self.with_machine(py, |m| m.snapshot());
         serde_json::to_string(&snap)
             .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
     }
@@ -229,21 +327,18 @@ impl Machine {
     ///
     /// Args:
     ///     json_snapshot (str): The JSON string from a previous `snapshot()` call.
-    fn restore(&mut self, json_snapshot: String) -> PyResult<()> {
-        let mut guard = self.inner.lock().unwrap();
+    fn restore(&self, py: Python<'_>, json_snapshot: String) -> PyResult<()> {
         let snap: labwired_core::snapshot::MachineSnapshot =
             serde_json::from_str(&json_snapshot)
                 .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
-        guard
-            .restore(&snap)
+        self.with_machine(py, |m| m.restore(&snap))
             .map_err(PySimulationError)
             .map_err(Into::into)
     }
 
     /// Get the current Program Counter (PC).
-    fn get_pc(&self) -> u32 {
-        let guard = self.inner.lock().unwrap();
-        guard.get_pc()
+    fn get_pc(&self, py: Python<'_>) -> u32 {
+        self.with_machine(py, |m| m.get_pc())
     }
 }
 
@@ -7,12 +7,14 @@ import json
 # In a real CI, we would build `firmware-ci-fixture` or `demo-blinky`.
 # For now, we expect the user to provide FIRMWARE_PATH env var or we look in default places.
 FIRMWARE_PATH = os.environ.get("LABWIRED_FIRMWARE", "../../examples/demo-blinky/target/thumbv7em-none-eabihf/debug/demo-blinky")
+# Optional system YAML; unset means the binding's default Cortex-M memory map.
+SYSTEM_CONFIG = os.environ.get("LABWIRED_SYSTEM")
 
 @pytest.fixture
 def machine():
     if not os.path.exists(FIRMWARE_PATH):
         pytest.skip(f"Firmware not found at {FIRMWARE_PATH}")
-    return labwired.Machine(FIRMWARE_PATH)
+    return labwired.Machine(FIRMWARE_PATH, SYSTEM_CONFIG)
 
 def test_initial_state(machine):
     # Cortex-M Reset Vector is usually at 0x00000004 or 0x08000004
@@ -29,15 +31,37 @@ def test_register_access(machine):
     machine.write_register(1, 0xCAFEBABE)
     assert machine.read_register(1) == 0xCAFEBABE
 
+def test_register_batch_access(machine):
+    # R0/R1 are scratch registers; one call each way for the whole batch
+    machine.write_registers({0: 0xDEADBEEF, 1: 0xCAFEBABE})
+    assert machine.read_registers([0, 1]) == [0xDEADBEEF, 0xCAFEBABE]
+    assert machine.read_register(1) == 0xCAFEBABE
+
 def test_memory_access(machine):
     # Write to RAM (usually 0x20000000)
     ram_addr = 0x20000000
-    data = [0x11, 0x22, 0x33, 0x44]
+    data = bytes([0x11, 0x22, 0x33, 0x44])
     
     machine.write_memory(ram_addr, data)
-    read_back = machine.read_memory(ram_addr, 4)
+    read_back = machine.read_memory(ram_addr, len(data))
     
-    assert list(read_back) == data
+    assert bytes(read_back) == data
+
+def test_memory_access_buffers(machine):
+    ram_addr = 0x20000000
+    payload = bytearray(range(64))
+
+    # Buffer-protocol objects are copied straight into guest memory
+    machine.write_memory(ram_addr, memoryview(payload)[16:])
+    machine.write_memory(ram_addr + 48, [0xAA] * 16)
+
+    out = bytearray(4096)
+    machine.read_memory_into(ram_addr, memoryview(out)[:64])
+    assert out[:48] == payload[16:]
+    assert out[48:64] == b"\xaa" * 16
+
+    with pytest.raises(BufferError):
+        machine.read_memory_into(ram_addr, bytes(4))
 
 def test_execution_steps(machine):
     start_pc = machine.get_pc()
@@ -48,6 +72,41 @@ def test_execution_steps(machine):
     # PC should change (unless it's an infinite loop on same instruction, which is rare for 10 steps from reset)
     assert end_pc != start_pc
 
+def test_step_many(machine):
+    reasons = machine.step_many([10, 10, 10])
+
+    assert [r.kind for r in reasons] == ["max_steps_reached"] * 3
+
+def test_access_from_another_thread_while_stepping(machine):
+    import threading
+
+    errors = []
+    started = threading.Event()
+
+    def run():
+        started.set()
+        try:
+            machine.step(5_000_000)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    started.wait()
+    # Each call waits for the machine lock rather than raising "Already
+    # borrowed" while the step runs with the GIL released. Values are not
+    # checked: the step may land before or after any of them.
+    calls_while_stepping = 0
+    while worker.is_alive():
+        machine.write_register(0, 0x12345678)
+        machine.read_register(0)
+        machine.get_pc()
+        calls_while_stepping += 1
+    worker.join()
+
+    assert errors == []
+    assert calls_while_stepping > 0, "step finished before any overlapping call"
+
 def test_snapshot_restore(machine):
     # 1. Run a bit
     machine.step(50)
@@ -77,17 +136,31 @@ def test_snapshot_restore(machine):
 def test_performance_benchmark(machine):
     """
     Test raw stepping performance. In release builds, this should be fast.
+
+    Timed on the monotonic perf counter, best of 3 runs, so NTP adjustments and
+    one-off scheduling noise do not show up in the reported number.
     """
     import time
-    
+
+    def best_of_3_ns(run):
+        runs = []
+        for _ in range(3):
+            start = time.perf_counter_ns()
+            run()
+            runs.append(time.perf_counter_ns() - start)
+        return min(runs)
+
     steps = 100_000
-    start = time.time()
-    machine.step(steps)
-    end = time.time()
-    
-    elapsed = end - start
-    ips = steps / elapsed
-    print(f"\n[Benchmark] {steps} steps in {elapsed:.4f}s => {ips:,.0f} instructions/sec")
-    
+    elapsed_ns = best_of_3_ns(lambda: machine.step(steps))
+    ips = steps * 1_000_000_000 // max(elapsed_ns, 1)
+    print(f"\n[Benchmark] {steps} steps in {elapsed_ns:,} ns => {ips:,} instructions/sec")
+
     # Very loose assertion just to ensure it runs, real performance depends on host
-    assert elapsed < 10.0, "Should handle 100k steps reasonably fast"
+    assert elapsed_ns < 10_000_000_000, "Should handle 100k steps reasonably fast"
+
+    # Same instruction count, split into batches run under one GIL release
+    batches = [steps // 10] * 10
+    elapsed_ns = best_of_3_ns(lambda: machine.step_many(batches))
+    ips = steps * 1_000_000_000 // max(elapsed_ns, 1)
+    print(f"[Benchmark] step_many({len(batches)} x {batches[0]}) in {elapsed_ns:,} ns => {ips:,} instructions/sec")
+    assert elapsed_ns < 10_000_000_000, "Should handle 100k batched steps reasonably fast"
@@ -27,12 +27,18 @@ from __future__ import annotations
 
 import argparse
 import json
+import selectors
 import subprocess
 import sys
 import time
 from pathlib import Path
 
 
+# Adapter output is pulled in chunks this large and framed out of a local buffer,
+# rather than fed to the header parser one byte per call.
+READ_CHUNK_BYTES = 64 * 1024
+
+
 class DapClient:
     """Minimal DAP client: Content-Length framed JSON over the adapter's stdio."""
 
@@ -45,7 +51,12 @@ class DapClient:
             cwd=cwd,
         )
         self.seq = 0
-        self.deadline = time.time() + timeout
+        self.deadline = time.monotonic() + timeout
+        self.rx = bytearray()
+        # Wait for adapter output with a timeout, so a stalled adapter cannot
+        # hold a read past the deadline.
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.proc.stdout, selectors.EVENT_READ)
 
     def send(self, command: str, arguments: dict | None = None) -> int:
         self.seq += 1
@@ -54,25 +65,54 @@ class DapClient:
             message["arguments"] = arguments
         payload = json.dumps(message).encode()
         assert self.proc.stdin is not None
-        self.proc.stdin.write(b"Content-Length: %d\r\n\r\n" % len(payload) + payload)
-        self.proc.stdin.flush()
+        # Queued, not flushed: requests sent back to back share one write to
+        # the pipe, issued by _fill() when we next wait for the adapter.
+        self.proc.stdin.write(b"Content-Length: %d\r\n\r\n" % len(payload))
+        self.proc.stdin.write(payload)
         return self.seq
 
+    def _fill(self) -> bool:
+        """Append whatever the adapter has written to `rx`; False on EOF/timeout."""
+        assert self.proc.stdin is not None and self.proc.stdout is not None
+        try:
+            self.proc.stdin.flush()
+        except BrokenPipeError:
+            return False
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0 or not self.selector.select(remaining):
+            return False
+        # read1() makes at most one read() on the pipe and never leaves data
+        # behind in the BufferedReader, so the selector sees everything unread.
+        chunk = self.proc.stdout.read1(READ_CHUNK_BYTES)
+        if not chunk:
+            return False
+        self.rx += chunk
+        return True
+
     def read(self) -> dict | None:
         """Read one DAP message, or None on EOF/timeout."""
-        assert self.proc.stdout is not None
-        header = b""
-        while b"\r\n\r\n" not in header:
-            if time.time() > self.deadline:
+        while (header_end := self.rx.find(b"\r\n\r\n")) < 0:
+            if not self._fill():
                 return None
-            byte = self.proc.stdout.read(1)
-            if not byte:
+        # Parse Content-Length straight out of `rx`: int() takes the digits as
+        # bytes (surrounding whitespace allowed), so nothing is decoded or copied.
+        field = self.rx.find(b"Content-Length:", 0, header_end)
+        if field < 0:
+            raise ValueError(f"DAP header without Content-Length: {bytes(self.rx[:header_end])!r}")
+        value_start = field + len(b"Content-Length:")
+        value_end = self.rx.find(b"\r\n", value_start, header_end)
+        length = int(self.rx[value_start : header_end if value_end < 0 else value_end])
+        body_start = header_end + 4
+        body_end = body_start + length
+        while len(self.rx) < body_end:
+            if not self._fill():
                 return None
-            header += byte
-        length = int(header.decode().split("Content-Length:")[1].split("\r\n")[0].strip())
-        return json.loads(self.proc.stdout.read(length))
+        body = self.rx[body_start:body_end]
+        del self.rx[:body_end]
+        return json.loads(body)
 
     def close(self) -> None:
+        self.selector.close()
         self.proc.kill()
 
 
@@ -113,8 +153,9 @@ def main() -> int:
     peripherals: list[dict] = []
     failures: list[str] = []
     saw_peripheral_response = False
+    saw_registers = False
 
-    while True:
+    while not (saw_registers and saw_peripheral_response):
         message = client.read()
         if message is None:
             failures.append("timed out or adapter exited before the surface was verified")
@@ -129,20 +170,25 @@ def main() -> int:
             break
 
         if command == "configurationDone":
+            # readPeripherals does not depend on the register chain, so it is
+            # pipelined with it rather than sent after the variables response.
             client.send("threads")
             client.send("stackTrace", {"threadId": 1})
             client.send("scopes", {"frameId": 0})
+            client.send("readPeripherals")
         elif command == "scopes":
-            for scope in message["body"]["scopes"]:
-                if scope["name"] == "Registers":
-                    client.send("variables", {"variablesReference": scope["variablesReference"]})
+            scopes = message["body"]["scopes"]
+            registers = [scope for scope in scopes if scope["name"] == "Registers"]
+            for scope in registers:
+                client.send("variables", {"variablesReference": scope["variablesReference"]})
+            # No Registers scope: nothing more to wait for, the assertions report it.
+            saw_registers = not registers
         elif command == "variables":
             cpu_registers = [(v["name"], v["value"]) for v in message["body"]["variables"]]
-            client.send("readPeripherals")
+            saw_registers = True
         elif command == "readPeripherals":
             saw_peripheral_response = True
             peripherals = message["body"].get("peripherals", [])
-            break
 
     client.close()
 
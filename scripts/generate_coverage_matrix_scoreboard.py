@@ -11,19 +11,129 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:
+    # Optional accelerator: the stdlib json module produces the same documents.
+    orjson = None  # type: ignore[assignment]
+
+# actions/download-artifact names each target's directory after its artifact.
+_ARTIFACT_PREFIX = "coverage-matrix-"
+
+# Artifact loads are I/O-bound (cold page cache on fresh runners, network
+# filesystems on self-hosted ones) and file reads release the GIL, so they are
+# overlapped across this many threads.
+_LOAD_WORKERS = 32
 
 
 def _load_json(path: Path) -> dict[str, Any] | None:
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text())
+        data = path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
     except Exception:
         return None
 
 
+def _dump_json(payload: Any, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0)
+    # ensure_ascii=False: orjson writes non-ASCII as raw UTF-8, and the
+    # artifact's bytes should not depend on whether orjson is installed.
+    if pretty:
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _walk_results(root: str) -> Iterator[str]:
+    """Yield the path of every result.json under `root`, in no particular order.
+
+    One os.scandir() per directory: the dirent type comes back with the listing,
+    so telling files from directories costs no extra stat() and no Path object
+    is built for entries that are not a result. Missing or unreadable
+    directories are skipped, as rglob does.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name == "result.json":
+                        yield entry.path
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+
+
+def _load_target(result_path: Path) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Load a target's result.json and its unsupported-instruction audit metrics."""
+    metrics_path = result_path.parent / "unsupported-audit" / "metrics.json"
+    return _load_json(result_path), _load_json(metrics_path)
+
+
+def _discover(matrix_root: Path) -> list[dict[str, Any]]:
+    """Return one scoreboard row per target under `matrix_root`, sorted by target ID.
+
+    Scanning recursively tolerates both flattened and nested artifact download
+    layouts. An empty root costs a single os.scandir() and yields no rows. When
+    the same target ID appears under several paths, the last path wins, with
+    paths ordered component by component as Path objects compare.
+    """
+    # The only sort: by (target ID, path components). Rows are then produced
+    # in target order, and duplicates of a target are adjacent with the winner
+    # last. Components, not path strings: as strings "x-y/zeta" sorts before
+    # "x/zeta" ('-' < '/'), which would flip which duplicate wins.
+    targets = sorted(
+        (path.parent.name.removeprefix(_ARTIFACT_PREFIX), path.parts, path)
+        for path in map(Path, _walk_results(str(matrix_root)))
+    )
+    result_paths = [path for _, _, path in targets]
+    # map() yields in submission order, so rows come out as if loaded serially.
+    with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as pool:
+        loaded = list(pool.map(_load_target, result_paths))
+
+    discovered: dict[str, dict[str, Any]] = {}
+    for (target_id, _, _), result_path, (result, metrics) in zip(targets, result_paths, loaded):
+        target_dir = result_path.parent
+
+        status = "missing"
+        stop_reason = "n/a"
+        instructions = 0
+        unsupported = "n/a"
+        support_pct = "n/a"
+
+        if result:
+            status = str(result.get("status", "unknown"))
+            stop_reason = str(result.get("stop_reason", "unknown"))
+            instructions = int(result.get("instructions", 0))
+
+        if metrics:
+            unsupported_val = metrics.get("unsupported_total", 0)
+            support_pct_val = metrics.get("instruction_support_percent", 0)
+            unsupported = str(unsupported_val)
+            support_pct = f"{float(support_pct_val):.2f}%"
+
+        discovered[target_id] = {
+            "target_id": target_id,
+            "status": status,
+            "stop_reason": stop_reason,
+            "instructions": instructions,
+            "unsupported_total": unsupported,
+            "instruction_support_percent": support_pct,
+            "artifact_path": str(target_dir),
+        }
+
+    return list(discovered.values())
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -41,6 +151,11 @@ def main() -> int:
         default="out/coverage-matrix/scoreboard.json",
         help="Path to write machine-readable scoreboard.",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON scoreboard for humans (default: compact).",
+    )
     parser.add_argument(
         "--required-target",
         action="append",
@@ -59,50 +174,25 @@ def main() -> int:
     if not matrix_root.exists():
         raise SystemExit(f"matrix root not found: {matrix_root}")
 
-    # Discover target outputs by scanning for result.json recursively.
-    # This tolerates both flattened and nested artifact download layouts.
-    discovered: dict[str, dict[str, Any]] = {}
-    for result_path in sorted(matrix_root.rglob("result.json")):
-        target_dir = result_path.parent
-        target_id = target_dir.name
-        if target_id.startswith("coverage-matrix-"):
-            target_id = target_id[len("coverage-matrix-") :]
+    rows = _discover(matrix_root)
 
-        result = _load_json(result_path)
-        metrics = _load_json(target_dir / "unsupported-audit" / "metrics.json")
-
-        status = "missing"
-        stop_reason = "n/a"
-        instructions = 0
-        unsupported = "n/a"
-        support_pct = "n/a"
-
-        if result:
-            status = str(result.get("status", "unknown"))
-            stop_reason = str(result.get("stop_reason", "unknown"))
-            instructions = int(result.get("instructions", 0))
-
-        if metrics:
-            unsupported_val = metrics.get("unsupported_total", 0)
-            support_pct_val = metrics.get("instruction_support_percent", 0)
-            unsupported = str(unsupported_val)
-            support_pct = f"{float(support_pct_val):.2f}%"
-
-        discovered[target_id] = {
-            "target_id": target_id,
-            "status": status,
-            "stop_reason": stop_reason,
-            "instructions": instructions,
-            "unsupported_total": unsupported,
-            "instruction_support_percent": support_pct,
-            "artifact_path": str(target_dir),
-        }
-
-    rows: list[dict[str, Any]] = [discovered[k] for k in sorted(discovered.keys())]
-
-    pass_count = sum(1 for r in rows if r["status"] == "pass")
-    fail_count = sum(1 for r in rows if r["status"] == "fail")
-    missing_count = sum(1 for r in rows if r["status"] not in {"pass", "fail"})
+    # One pass over the rows for both the summary and the required-target gate.
+    # Anything that is neither pass nor fail (missing, unknown, ...) counts as
+    # missing. Target IDs are unique in `rows`, so presence is a plain count.
+    required_targets = frozenset(args.required_target)
+    required_present: set[str] = set()
+    required_pass = 0
+    status_counts: Counter[str] = Counter()
+    for r in rows:
+        status = r["status"]
+        status_counts[status] += 1
+        if r["target_id"] in required_targets:
+            required_present.add(r["target_id"])
+            if status == "pass":
+                required_pass += 1
+    pass_count = status_counts["pass"]
+    fail_count = status_counts["fail"]
+    missing_count = len(rows) - pass_count - fail_count
 
     markdown_lines = [
         "# Coverage Matrix Scoreboard",
@@ -115,26 +205,20 @@ def main() -> int:
         "| Target | Status | Stop Reason | Instructions | Unsupported | Instruction Support | Artifact |",
         "|---|---|---|---:|---:|---:|---|",
     ]
-    for row in rows:
-        markdown_lines.append(
-            "| `{target_id}` | `{status}` | `{stop_reason}` | `{instructions}` | `{unsupported_total}` | `{instruction_support_percent}` | `{artifact_path}` |".format(
-                **row
-            )
-        )
+    markdown_lines.extend(
+        f"| `{r['target_id']}` | `{r['status']}` | `{r['stop_reason']}` | `{r['instructions']}` | `{r['unsupported_total']}` | `{r['instruction_support_percent']}` | `{r['artifact_path']}` |"
+        for r in rows
+    )
     markdown_lines.append("")
 
     markdown_out = Path(args.markdown_out)
     markdown_out.parent.mkdir(parents=True, exist_ok=True)
-    markdown_out.write_text("\n".join(markdown_lines))
+    markdown_out.write_bytes("\n".join(markdown_lines).encode("utf-8"))
 
     json_out = Path(args.json_out)
     json_out.parent.mkdir(parents=True, exist_ok=True)
-    required_targets = set(args.required_target)
-    required_rows = [r for r in rows if r["target_id"] in required_targets]
-    required_present = {r["target_id"] for r in required_rows}
     missing_required = sorted(required_targets - required_present)
-    required_pass = sum(1 for r in required_rows if r["status"] == "pass")
-    required_total = len(required_rows)
+    required_total = len(required_present)
     required_rate = (required_pass / required_total) if required_total else 0.0
 
     if required_targets:
@@ -157,8 +241,8 @@ def main() -> int:
                 f"- missing required targets: `{', '.join(missing_required)}`"
             )
 
-    json_out.write_text(
-        json.dumps(
+    json_out.write_bytes(
+        _dump_json(
             {
                 "targets": rows,
                 "summary": {
@@ -177,8 +261,8 @@ def main() -> int:
                     "required_pass_rate_threshold": args.min_required_pass_rate,
                 },
             },
-            indent=2,
-        )
+            pretty=args.pretty,
+        ),
     )
 
     if args.min_required_pass_rate is not None:
@@ -4,60 +4,197 @@
 from __future__ import annotations
 
 import argparse
+import array
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from statistics import median
+from typing import Iterator
 
+try:
+    import orjson
+except ImportError:
+    # Optional accelerator: the stdlib json module produces the same document.
+    orjson = None  # type: ignore[assignment]
 
-def load_metrics(root: Path) -> list[dict]:
-    metrics: list[dict] = []
-    for path in sorted(root.rglob("onboarding-metrics.json")):
+METRICS_FILENAME = "onboarding-metrics.json"
+
+# From this many targets up, the median comes from a fixed-width histogram
+# (one pass, no sort) instead of statistics.median(); below it the exact value
+# is cheap enough.
+BINNED_MEDIAN_MIN_TARGETS = 1024
+
+LOAD_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+ROW_FORMAT = "| `%s` | `%s` | `%s` | `%s` | `%s` | `%s` | `%s` | `%s` |\n"
+
+
+def _scan(root: str) -> Iterator[str]:
+    """Yield every onboarding-metrics.json under `root`, in no particular order.
+
+    Uses the dirent type cached by os.scandir(), so no stat() or Path object is
+    spent on the other entries. Missing or unreadable directories are skipped,
+    as rglob does.
+    """
+    stack = [root]
+    while stack:
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == METRICS_FILENAME and entry.is_file():
+                        yield entry.path
+        except OSError:
             continue
-        data["_artifact_path"] = str(path.parent)
-        metrics.append(data)
-    return metrics
 
 
-def build_markdown(metrics: list[dict], threshold_seconds: int) -> str:
-    total = len(metrics)
-    passing = sum(1 for m in metrics if m.get("status") == "pass")
-    failing = total - passing
-    elapsed_values_ms = [int(m.get("elapsed_ms", int(m.get("elapsed_seconds", 0)) * 1000)) for m in metrics]
-    median_elapsed_ms = int(median(elapsed_values_ms)) if elapsed_values_ms else 0
-    median_elapsed_seconds = round(median_elapsed_ms / 1000.0, 3)
-    threshold_hits = sum(1 for m in metrics if bool(m.get("threshold_met")))
-
-    lines = [
-        "# Onboarding Smoke Scoreboard",
-        "",
-        f"- targets_total: `{total}`",
-        f"- pass: `{passing}`",
-        f"- fail: `{failing}`",
-        f"- median_elapsed_ms: `{median_elapsed_ms}`",
-        f"- median_elapsed_seconds: `{median_elapsed_seconds}`",
-        f"- threshold_seconds: `{threshold_seconds}`",
-        f"- threshold_met: `{threshold_hits}/{total}`",
-        "",
-        "| Target | Status | Elapsed (ms) | Elapsed (s) | Threshold Met | Failure Stage | Hint | Signature |",
-        "|---|---|---:|---:|---|---|---|---|",
-    ]
-
-    for m in sorted(metrics, key=lambda row: row.get("target_id", "")):
-        target = m.get("target_id", "unknown")
-        status = m.get("status", "missing")
-        elapsed_ms = int(m.get("elapsed_ms", int(m.get("elapsed_seconds", 0)) * 1000))
+def _read_one(path: str) -> dict | None:
+    try:
+        raw = Path(path).read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        return None
+    data["_artifact_path"] = os.path.dirname(path)
+    return data
+
+
+def load_metrics(root: Path) -> list[dict]:
+    # Each artifact is a small file whose cost is read latency, not parsing, so
+    # the reads are overlapped on a thread pool. map() keeps the sorted order,
+    # which compares paths component by component (as sorting Path objects
+    # does) so "a/x" stays ahead of "a-x" and the targets order is stable.
+    paths = sorted(_scan(str(root)), key=lambda path: Path(path).parts)
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as pool:
+        return [data for data in pool.map(_read_one, paths) if data is not None]
+
+
+def binned_median_ms(values: list[int], bin_ms: int = 1000, max_ms: int = 4 * 3600 * 1000) -> int:
+    """Approximate median of `values` from a histogram of `bin_ms`-wide bins.
+
+    Returns the midpoint of the bin holding the lower median, so the result is
+    within bin_ms/2 of it. Values at or above `max_ms` share the last bin and
+    negative ones the first, which only matters if the median itself is there.
+    """
+    counts = array.array("I", [0]) * (max_ms // bin_ms + 1)
+    last = len(counts) - 1
+    for v in values:
+        counts[max(0, min(v // bin_ms, last))] += 1
+    half = (len(values) + 1) // 2
+    cumulative = 0
+    for idx, count in enumerate(counts):
+        cumulative += count
+        if cumulative >= half:
+            return idx * bin_ms + bin_ms // 2
+    return 0
+
+
+def _median_ms(values: list[int]) -> int:
+    if not values:
+        return 0
+    if len(values) >= BINNED_MEDIAN_MIN_TARGETS:
+        return binned_median_ms(values)
+    return int(median(values))
+
+
+def _elapsed_ms(m: dict) -> int:
+    """Elapsed time of one record in ms; older smoke runs only wrote whole seconds."""
+    return int(m.get("elapsed_ms", int(m.get("elapsed_seconds", 0)) * 1000))
+
+
+def _fold(metrics: list[dict]) -> tuple[int, int, int, list[int]]:
+    """Aggregate `metrics` in one pass: (total, passing, threshold_hits, elapsed ms)."""
+    total = passing = threshold_hits = 0
+    elapsed_values_ms: list[int] = []
+    for m in metrics:
+        g = m.get
+        total += 1
+        if g("status") == "pass":
+            passing += 1
+        if g("threshold_met"):
+            threshold_hits += 1
+        elapsed_values_ms.append(_elapsed_ms(m))
+    return total, passing, threshold_hits, elapsed_values_ms
+
+
+def _dump_json(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    # orjson writes non-ASCII (e.g. the curly quotes in compiler diagnostics)
+    # as raw UTF-8; match it so the artifact does not depend on orjson.
+    return (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def summarize(metrics: list[dict], threshold_seconds: int) -> dict:
+    """The scoreboard summary, as written to the JSON payload."""
+    total, passing, threshold_hits, elapsed_values_ms = _fold(metrics)
+    median_elapsed_ms = _median_ms(elapsed_values_ms)
+    return {
+        "targets_total": total,
+        "pass": passing,
+        "fail": total - passing,
+        "median_elapsed_ms": median_elapsed_ms,
+        "threshold_seconds": threshold_seconds,
+        "threshold_met": threshold_hits,
+        "median_elapsed_seconds": round(median_elapsed_ms / 1000.0, 3),
+    }
+
+
+def iter_markdown_lines(
+    metrics: list[dict], threshold_seconds: int, summary: dict | None = None
+) -> Iterator[str]:
+    """Yield the scoreboard markdown one newline-terminated line at a time.
+
+    `summary` is the result of summarize(); pass it when the caller already has
+    it so the metrics are not folded a second time.
+    """
+    if summary is None:
+        summary = summarize(metrics, threshold_seconds)
+
+    yield "# Onboarding Smoke Scoreboard\n"
+    yield "\n"
+    yield f"- targets_total: `{summary['targets_total']}`\n"
+    yield f"- pass: `{summary['pass']}`\n"
+    yield f"- fail: `{summary['fail']}`\n"
+    # From BINNED_MEDIAN_MIN_TARGETS records up the median is binned; say so.
+    approximate = summary["targets_total"] >= BINNED_MEDIAN_MIN_TARGETS
+    median_note = " (approximate: 1 s bins)" if approximate else ""
+    yield f"- median_elapsed_ms: `{summary['median_elapsed_ms']}`{median_note}\n"
+    yield f"- median_elapsed_seconds: `{summary['median_elapsed_seconds']}`\n"
+    yield f"- threshold_seconds: `{summary['threshold_seconds']}`\n"
+    yield f"- threshold_met: `{summary['threshold_met']}/{summary['targets_total']}`\n"
+    yield "\n"
+    yield "| Target | Status | Elapsed (ms) | Elapsed (s) | Threshold Met | Failure Stage | Hint | Signature |\n"
+    yield "|---|---|---:|---:|---|---|---|---|\n"
+
+    # `or ""` so a record with "target_id": null sorts first instead of
+    # raising TypeError against the string ids.
+    for m in sorted(metrics, key=lambda row: row.get("target_id") or ""):
+        g = m.get
+        target = g("target_id", "unknown")
+        status = g("status", "missing")
+        elapsed_ms = _elapsed_ms(m)
         elapsed_seconds = round(elapsed_ms / 1000.0, 3)
-        threshold_met = m.get("threshold_met", False)
-        failure_stage = m.get("failure_stage") or "n/a"
-        hint = (m.get("failure_hint") or "n/a").replace("|", "/")
-        signature = (m.get("first_error_signature") or "n/a").replace("|", "/")
-        lines.append(
-            f"| `{target}` | `{status}` | `{elapsed_ms}` | `{elapsed_seconds}` | `{threshold_met}` | `{failure_stage}` | `{hint}` | `{signature}` |"
+        threshold_met = g("threshold_met", False)
+        failure_stage = g("failure_stage") or "n/a"
+        hint = (g("failure_hint") or "n/a").replace("|", "/")
+        signature = (g("first_error_signature") or "n/a").replace("|", "/")
+        yield ROW_FORMAT % (
+            target,
+            status,
+            elapsed_ms,
+            elapsed_seconds,
+            threshold_met,
+            failure_stage,
+            hint,
+            signature,
         )
-    return "\n".join(lines) + "\n"
+
+
+def build_markdown(metrics: list[dict], threshold_seconds: int) -> str:
+    return "".join(iter_markdown_lines(metrics, threshold_seconds))
 
 
 def main() -> int:
@@ -69,27 +206,14 @@ def main() -> int:
     args = parser.parse_args()
 
     metrics = load_metrics(args.metrics_root)
-    summary = {
-        "targets_total": len(metrics),
-        "pass": sum(1 for m in metrics if m.get("status") == "pass"),
-        "fail": sum(1 for m in metrics if m.get("status") != "pass"),
-        "median_elapsed_ms": int(
-            median([int(m.get("elapsed_ms", int(m.get("elapsed_seconds", 0)) * 1000)) for m in metrics])
-        )
-        if metrics
-        else 0,
-        "threshold_seconds": args.soft_threshold_seconds,
-        "threshold_met": sum(1 for m in metrics if bool(m.get("threshold_met"))),
-    }
-    summary["median_elapsed_seconds"] = round(summary["median_elapsed_ms"] / 1000.0, 3)
+    summary = summarize(metrics, args.soft_threshold_seconds)
     payload = {"summary": summary, "targets": metrics}
 
     args.markdown_out.parent.mkdir(parents=True, exist_ok=True)
     args.json_out.parent.mkdir(parents=True, exist_ok=True)
-    args.markdown_out.write_text(
-        build_markdown(metrics, args.soft_threshold_seconds), encoding="utf-8"
-    )
-    args.json_out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    with args.markdown_out.open("w", encoding="utf-8", buffering=1 << 20) as markdown:
+        markdown.writelines(iter_markdown_lines(metrics, args.soft_threshold_seconds, summary))
+    args.json_out.write_bytes(_dump_json(payload))
     return 0
 
 
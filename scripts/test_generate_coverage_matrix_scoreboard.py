@@ -0,0 +1,172 @@
+# LabWired - Firmware Simulation Platform
+# Copyright (C) 2026 Andrii Shylenko
+# SPDX-License-Identifier: MIT
+"""Tests for the coverage-matrix scoreboard aggregator.
+
+The scoreboard is what the required-target gate reads, so what is pinned down
+here is discovery: every target's result.json is found whether the artifacts
+were downloaded flattened or nested, the `coverage-matrix-` artifact prefix is
+stripped, and a target with an unreadable result still shows up as `missing`
+instead of disappearing from the table.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import generate_coverage_matrix_scoreboard as gcms  # noqa: E402
+
+
+def write_json(path: Path, payload) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload))
+
+
+def make_matrix(root: Path) -> None:
+    write_json(
+        root / "coverage-matrix-alpha" / "result.json",
+        {"status": "pass", "stop_reason": "halt", "instructions": 10},
+    )
+    write_json(
+        root / "coverage-matrix-alpha" / "unsupported-audit" / "metrics.json",
+        {"unsupported_total": 2, "instruction_support_percent": 97.5},
+    )
+    write_json(
+        root / "nested" / "coverage-matrix-beta" / "result.json",
+        {"status": "fail", "stop_reason": "timeout", "instructions": 3},
+    )
+    (root / "gamma").mkdir()
+    (root / "gamma" / "result.json").write_text("not json")
+
+
+def run(monkeypatch, tmp_path: Path, *extra: str) -> tuple[int, dict, str]:
+    markdown_out = tmp_path / "out" / "scoreboard.md"
+    json_out = tmp_path / "out" / "scoreboard.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "generate_coverage_matrix_scoreboard.py",
+            "--matrix-root",
+            str(tmp_path / "matrix"),
+            "--markdown-out",
+            str(markdown_out),
+            "--json-out",
+            str(json_out),
+            *extra,
+        ],
+    )
+    rc = gcms.main()
+    return rc, json.loads(json_out.read_text()), markdown_out.read_text()
+
+
+def test_walk_finds_flattened_and_nested_results(tmp_path):
+    make_matrix(tmp_path)
+    found = sorted(gcms._walk_results(str(tmp_path)))
+    assert found == sorted(
+        str(p)
+        for p in (
+            tmp_path / "coverage-matrix-alpha" / "result.json",
+            tmp_path / "gamma" / "result.json",
+            tmp_path / "nested" / "coverage-matrix-beta" / "result.json",
+        )
+    )
+
+
+def test_walk_skips_unreadable_and_missing_directories(monkeypatch, tmp_path):
+    write_json(tmp_path / "alpha" / "result.json", {"status": "pass"})
+    write_json(tmp_path / "locked" / "result.json", {"status": "pass"})
+    scandir = gcms.os.scandir
+
+    def guarded_scandir(path):
+        if path.endswith("locked"):
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(gcms.os, "scandir", guarded_scandir)
+    assert list(gcms._walk_results(str(tmp_path))) == [str(tmp_path / "alpha" / "result.json")]
+    assert list(gcms._walk_results(str(tmp_path / "absent"))) == []
+
+
+def test_scoreboard_rows_and_summary(monkeypatch, tmp_path):
+    make_matrix(tmp_path / "matrix")
+    rc, payload, markdown = run(monkeypatch, tmp_path)
+
+    assert rc == 0
+    rows = {row["target_id"]: row for row in payload["targets"]}
+    assert list(rows) == ["alpha", "beta", "gamma"]
+    assert rows["alpha"]["instruction_support_percent"] == "97.50%"
+    assert rows["beta"]["unsupported_total"] == "n/a"
+    assert rows["gamma"]["status"] == "missing"
+    assert payload["summary"] == {"targets_total": 3, "pass": 1, "fail": 1, "missing": 1}
+    assert "| `alpha` | `pass` | `halt` | `10` | `2` | `97.50%` |" in markdown
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_json_keeps_non_ascii_as_utf8(monkeypatch, tmp_path, pretty):
+    # Same bytes whether or not orjson is installed, compact or pretty.
+    write_json(tmp_path / "matrix" / "alpha" / "result.json", {"stop_reason": "\u2018halt\u2019"})
+    run(monkeypatch, tmp_path, *(["--pretty"] if pretty else []))
+
+    written = (tmp_path / "out" / "scoreboard.json").read_bytes()
+    separator = ": " if pretty else ":"
+    assert f'"stop_reason"{separator}"\u2018halt\u2019"'.encode("utf-8") in written
+
+
+def test_required_gate_reports_missing_target(monkeypatch, tmp_path):
+    make_matrix(tmp_path / "matrix")
+    rc, payload, _ = run(
+        monkeypatch,
+        tmp_path,
+        "--required-target",
+        "alpha",
+        "--required-target",
+        "delta",
+        "--min-required-pass-rate",
+        "1.0",
+    )
+
+    assert rc == 2
+    gate = payload["required_gate"]
+    assert gate["required_present"] == ["alpha"]
+    assert gate["required_missing"] == ["delta"]
+    assert gate["required_pass"] == 1
+
+
+def test_empty_matrix_writes_empty_scoreboard(monkeypatch, tmp_path):
+    (tmp_path / "matrix").mkdir()
+    rc, payload, markdown = run(monkeypatch, tmp_path, "--required-target", "alpha")
+
+    assert rc == 0
+    assert payload["targets"] == []
+    assert payload["summary"]["targets_total"] == 0
+    assert payload["required_gate"]["required_missing"] == ["alpha"]
+    assert markdown.endswith("|---|---|---|---:|---:|---:|---|\n")
+
+
+def test_duplicate_target_keeps_last_path(monkeypatch, tmp_path):
+    # x sorts before its prefix sibling x-y as a path, but after it as a string.
+    matrix = tmp_path / "matrix"
+    write_json(matrix / "x" / "coverage-matrix-zeta" / "result.json", {"status": "fail"})
+    write_json(matrix / "x-y" / "zeta" / "result.json", {"status": "pass"})
+    write_json(matrix / "alpha" / "result.json", {"status": "pass"})
+    _, payload, _ = run(monkeypatch, tmp_path)
+
+    assert [(r["target_id"], r["status"]) for r in payload["targets"]] == [
+        ("alpha", "pass"),
+        ("zeta", "pass"),
+    ]
+
+
+def test_duplicate_target_orders_paths_by_component(monkeypatch, tmp_path):
+    # As strings "x-y/zeta" < "x/zeta"; as paths x < x-y, so x-y is last and wins.
+    matrix = tmp_path / "matrix"
+    write_json(matrix / "x" / "zeta" / "result.json", {"status": "pass"})
+    write_json(matrix / "x-y" / "zeta" / "result.json", {"status": "fail"})
+    _, payload, _ = run(monkeypatch, tmp_path)
+
+    assert [(r["target_id"], r["status"]) for r in payload["targets"]] == [("zeta", "fail")]
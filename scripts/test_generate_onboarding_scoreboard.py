@@ -0,0 +1,122 @@
+# LabWired - Firmware Simulation Platform
+# Copyright (C) 2026 Andrii Shylenko
+# SPDX-License-Identifier: MIT
+"""Tests for the onboarding smoke scoreboard aggregator.
+
+Pinned down here: every onboarding-metrics.json is found however deep the
+artifact download nests it, a corrupt one is dropped rather than failing the
+scoreboard, and records written in seconds (older smoke runs) and in
+milliseconds land on the same scale.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import generate_onboarding_scoreboard as gos  # noqa: E402
+
+
+def write_metrics(path: Path, payload) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / gos.METRICS_FILENAME).write_text(json.dumps(payload))
+
+
+def make_metrics(root: Path) -> None:
+    write_metrics(
+        root / "onboarding-smoke-zeta",
+        {"target_id": "zeta", "status": "pass", "elapsed_ms": 1500, "threshold_met": True},
+    )
+    write_metrics(
+        root / "nested" / "onboarding-smoke-alpha",
+        {
+            "target_id": "alpha",
+            "status": "fail",
+            "elapsed_seconds": 7,
+            "threshold_met": False,
+            "failure_hint": "build|link",
+        },
+    )
+    (root / "broken").mkdir()
+    (root / "broken" / gos.METRICS_FILENAME).write_text("{")
+
+
+def test_load_metrics_finds_nested_and_skips_corrupt(tmp_path):
+    make_metrics(tmp_path)
+    metrics = gos.load_metrics(tmp_path)
+
+    assert sorted(m["target_id"] for m in metrics) == ["alpha", "zeta"]
+    by_id = {m["target_id"]: m for m in metrics}
+    assert by_id["alpha"]["_artifact_path"] == str(tmp_path / "nested" / "onboarding-smoke-alpha")
+
+
+def test_load_metrics_skips_unreadable_directories(monkeypatch, tmp_path):
+    make_metrics(tmp_path)
+    scandir = gos.os.scandir
+
+    def guarded_scandir(path):
+        if path.endswith("nested"):
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(gos.os, "scandir", guarded_scandir)
+    assert [m["target_id"] for m in gos.load_metrics(tmp_path)] == ["zeta"]
+
+
+def test_load_metrics_orders_paths_by_component(tmp_path):
+    # As strings "a-x/..." < "a/..."; as paths a < a-x.
+    for parts in (("a", "x", "gamma"), ("a-x", "beta"), ("a", "alpha")):
+        write_metrics(tmp_path.joinpath(*parts), {"target_id": parts[-1]})
+
+    assert [m["target_id"] for m in gos.load_metrics(tmp_path)] == ["alpha", "gamma", "beta"]
+
+
+def test_load_metrics_missing_root(tmp_path):
+    assert gos.load_metrics(tmp_path / "absent") == []
+
+
+def test_build_markdown_summary_and_rows(tmp_path):
+    make_metrics(tmp_path)
+    markdown = gos.build_markdown(gos.load_metrics(tmp_path), 3600)
+
+    assert "- targets_total: `2`" in markdown
+    assert "- pass: `1`" in markdown
+    assert "- median_elapsed_ms: `4250`\n" in markdown
+    assert "- threshold_met: `1/2`" in markdown
+    rows = [line for line in markdown.splitlines() if line.startswith("| `")]
+    assert rows == [
+        "| `alpha` | `fail` | `7000` | `7.0` | `False` | `n/a` | `build/link` | `n/a` |",
+        "| `zeta` | `pass` | `1500` | `1.5` | `True` | `n/a` | `n/a` | `n/a` |",
+    ]
+
+
+def test_large_sets_use_binned_median():
+    # Lower median is 1234 ms; the binned value is the midpoint of its 1 s bin.
+    values = [1234] * 600 + [50_000] * (gos.BINNED_MEDIAN_MIN_TARGETS - 600)
+    assert gos.binned_median_ms(values) == 1500
+    metrics = [{"status": "pass", "elapsed_ms": v} for v in values]
+    markdown = gos.build_markdown(metrics, 3600)
+    assert "- median_elapsed_ms: `1500` (approximate: 1 s bins)\n" in markdown
+
+
+def test_binned_median_clamps_slow_outliers_into_last_bin():
+    values = [10 * 3600 * 1000] * 3
+    assert gos.binned_median_ms(values, bin_ms=1000, max_ms=4000) == 4500
+
+
+def test_binned_median_clamps_negative_values_into_first_bin():
+    assert gos.binned_median_ms([-500] * 3) == 500
+
+
+def test_null_target_id_sorts_first():
+    markdown = gos.build_markdown([{"target_id": "beta"}, {"target_id": None}], 3600)
+    rows = [line for line in markdown.splitlines() if line.startswith("| `")]
+    assert [row.split("`")[1] for row in rows] == ["None", "beta"]
+
+
+def test_json_keeps_non_ascii_as_utf8():
+    # Same bytes whether or not orjson is installed.
+    payload = {"failure_hint": "expected \u2018;\u2019"}
+    expected = '{\n  "failure_hint": "expected \u2018;\u2019"\n}\n'.encode("utf-8")
+    assert gos._dump_json(payload) == expected
@@ -2,6 +2,7 @@ import subprocess
 import time
 import os
 import signal
+import socket
 from pygdbmi.gdbcontroller import GdbController
 
 # Configuration
@@ -9,6 +10,22 @@ LABWIRED_BIN = "/home/andrii/Projects/labwired/core/target/release/labwired"
 FIRMWARE_BIN = "/home/andrii/Projects/labwired/core/target/thumbv7m-none-eabi/debug/demo-blinky"
 GDB_PORT = 3333
 
+def wait_for_listener(process, port, timeout=10.0):
+    # The stub accepts exactly one client, so probing with connect() would use
+    # up the session GDB needs. bind() fails instead once the port is listening.
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while time.monotonic() < deadline and process.poll() is None:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                probe.bind(("0.0.0.0", port))
+            except OSError:
+                return True
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.2)
+    return False
+
 def test_gdb_sticky_breakpoint():
     print("Starting LabWired GDB E2E Test...")
 
@@ -17,12 +34,12 @@ def test_gdb_sticky_breakpoint():
     cmd = [LABWIRED_BIN, "--gdb", str(GDB_PORT), "--firmware", FIRMWARE_BIN]
     process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
 
-    time.sleep(2)  # Give it a bit more time to start
-
     gdb = None
     try:
-        # Check if process is still running
-        if process.poll() is not None:
+        # Wait for the GDB port to open (or the process to die)
+        if not wait_for_listener(process, GDB_PORT):
+             if process.poll() is None:
+                  raise Exception(f"LabWired did not open GDB port {GDB_PORT}")
              out, err = process.communicate()
              print(f"ERROR: LabWired exited prematurely with code {process.returncode}")
              print(f"STDOUT: {out}")
@@ -45,18 +62,23 @@ def test_gdb_sticky_breakpoint():
         resp = gdb.write("continue")
         print(f"Continue Response: {resp}")
 
-        # Wait for stop
+        # Wait for stop: short reads first, backing off, so an early stop is
+        # seen within milliseconds rather than on the next 0.5 s poll
         stop_found = False
-        for i in range(20):
-            response = gdb.get_gdb_response(timeout_sec=0.5)
+        deadline = time.monotonic() + 10
+        delay = 0.01
+        while not stop_found and time.monotonic() < deadline:
+            response = gdb.get_gdb_response(
+                timeout_sec=max(0.001, min(delay, deadline - time.monotonic())),
+                raise_error_on_timeout=False,
+            )
             # print(f"GDB Response: {response}") # Too verbose, but useful if needed
             for r in response:
                 if r['message'] == 'stopped':
                      stop_found = True
                      print(f"STOPPED at: {r['payload'].get('frame', {}).get('addr', 'unknown')}")
                      break
-            if stop_found: break
-            time.sleep(0.5)
+            delay = min(delay * 1.5, 0.2)
 
         if not stop_found:
              out, err = process.communicate()
@@ -32,9 +32,9 @@ def main():
     print(f"Stop Reason: {reason}")
     print(f"Current PC: {machine.get_pc():#x}")
     
-    # Inspect Registers (R0-R12 are 0-12)
-    r0 = machine.read_register(0)
-    print(f"R0: {r0:#x}")
+    # Inspect Registers (R0-R12 are 0-12), fetched in one call
+    for i, val in enumerate(machine.read_registers(range(4))):
+        print(f"R{i}: {val:#x}")
     
     # Snapshot Test
     print("Taking Snapshot...")